@@ -1,3 +1,5 @@
+from simplify import RegexSimplifier
+
 def convert_dfa_to_regex(dfa):
     import copy
 
@@ -17,52 +19,48 @@ def convert_dfa_to_regex(dfa):
     states = [new_start] + states + [new_end]
     transitions = {}
 
+    # Labels are simplified as they are built, so they stay small during elimination
+    regex = RegexSimplifier()
+    empty = regex.empty
+
     # Initialize all transitions to ∅ (empty)
     for s1 in states:
         for s2 in states:
-            transitions[(s1, s2)] = "∅"
+            transitions[(s1, s2)] = empty
 
     # Add DFA transitions
     for (from_state, symbol), to_state in dfa.transitions.items():
         key = (from_state, to_state)
-        if transitions[key] != "∅":
-            transitions[key] = f"({transitions[key]}+{symbol})"
-        else:
-            transitions[key] = symbol
+        transitions[key] = regex.union(transitions[key], regex.symbol(symbol))
 
     # Add ε transitions from new start and to new end
-    transitions[(new_start, dfa.start_state)] = "ε"
+    transitions[(new_start, dfa.start_state)] = regex.epsilon
     for accept_state in dfa.accept_states:
-        transitions[(accept_state, new_end)] = "ε"
+        transitions[(accept_state, new_end)] = regex.epsilon
 
     # Step 2: Eliminate all intermediate states except new_start and new_end
     intermediate_states = [s for s in states if s not in [new_start, new_end]]
 
     for state in intermediate_states:
-        loop = transitions.get((state, state), "∅")
-        loop_expr = f"({loop})*" if loop != "∅" else ""
+        loop_expr = regex.star(transitions.get((state, state), empty))
 
         for i in states:
             if i == state:
                 continue
-            in_label = transitions.get((i, state), "∅")
-            if in_label == "∅":
+            in_label = transitions.get((i, state), empty)
+            if in_label is empty:
                 continue
 
             for j in states:
                 if j == state:
                     continue
-                out_label = transitions.get((state, j), "∅")
-                if out_label == "∅":
+                out_label = transitions.get((state, j), empty)
+                if out_label is empty:
                     continue
 
-                mid_expr = f"{in_label}{loop_expr}{out_label}"
-                current = transitions.get((i, j), "∅")
-
-                if current == "∅":
-                    transitions[(i, j)] = mid_expr
-                else:
-                    transitions[(i, j)] = f"({current}+{mid_expr})"
+                mid_expr = regex.concat(in_label, loop_expr, out_label)
+                current = transitions.get((i, j), empty)
+                transitions[(i, j)] = regex.union(current, mid_expr)
 
         # Remove transitions involving the eliminated state
         for s in states:
@@ -70,7 +68,7 @@ def convert_dfa_to_regex(dfa):
             transitions.pop((state, s), None)
 
     # Step 3: Final expression from new_start to new_end
-    regex = transitions.get((new_start, new_end), "∅")
-    if regex == "∅":
+    result = transitions.get((new_start, new_end), empty)
+    if result is empty:
         return "No accepting paths"
-    return regex
+    return regex.to_string(result)
@@ -0,0 +1,266 @@
+class Regex:
+    """A hash-consed regular expression node.
+
+    Nodes are only created through a RegexSimplifier, which guarantees that
+    structurally equal expressions are the same object, so equality and
+    hashing are by identity and cost O(1).
+    """
+    __slots__ = ("kind", "value", "children", "uid", "nullable")
+
+    def __init__(self, kind, value, children, uid, nullable):
+        self.kind = kind            # "empty", "eps", "sym", "cat", "alt" or "star"
+        self.value = value          # symbol text for "sym", otherwise None
+        self.children = children    # tuple of child nodes
+        self.uid = uid
+        self.nullable = nullable    # True if the language contains ε
+
+    def __repr__(self):
+        return f"Regex({self.kind}, {self.value!r}, uid={self.uid})"
+
+
+class RegexSimplifier:
+    """Builds regular expressions while applying algebraic identities.
+
+    Every constructor returns an already simplified node, so expressions stay
+    small while they are being built (e.g. during state elimination):
+
+        ∅ absorption:     r∅ = ∅r = ∅,  r+∅ = r
+        ε absorption:     rε = εr = r,  ε+r = r when r is nullable
+        star rules:       ∅* = ε* = ε,  (r*)* = r*,  (ε+r)* = r*,
+                          (r+s*)* = (r+s)*,  (r*s*)* = (r*+s*)*,  r*r* = r*
+        union:            duplicates removed, alternatives sorted,
+                          r+r* = r*, common prefix/suffix factored out
+
+    Nodes are hash-consed, and the results of union and star are cached
+    by the uids of their arguments, so rewriting the same subexpressions again
+    (as state elimination often does) is a dictionary lookup.
+    """
+
+    def __init__(self):
+        self._nodes = {}
+        self._text = {}
+        self._unions = {}
+        self._stars = {}
+        self.empty = self._make("empty", None, (), False)
+        self.epsilon = self._make("eps", None, (), True)
+
+    def _make(self, kind, value, children, nullable):
+        key = (kind, value, tuple(c.uid for c in children))
+        node = self._nodes.get(key)
+        if node is None:
+            node = Regex(kind, value, children, len(self._nodes), nullable)
+            self._nodes[key] = node
+        return node
+
+    @staticmethod
+    def _order(node):
+        """Sort key for union alternatives: ε first, then symbols, then the rest"""
+        if node.kind == "eps":
+            return (0, "", 0)
+        if node.kind == "sym":
+            return (1, node.value, 0)
+        return (2, "", node.uid)
+
+    @staticmethod
+    def _parts(node):
+        """View a node as a sequence of concatenated factors"""
+        if node.kind == "cat":
+            return node.children
+        if node.kind == "eps":
+            return ()
+        return (node,)
+
+    def symbol(self, name):
+        name = name.strip()
+        if name == "ε":
+            return self.epsilon
+        if name == "∅":
+            return self.empty
+        return self._make("sym", name, (), False)
+
+    def concat(self, *nodes):
+        parts = []
+        for node in nodes:
+            if node.kind == "empty":
+                return self.empty
+            for part in self._parts(node):
+                # r*r* = r*
+                if part.kind == "star" and parts and parts[-1] is part:
+                    continue
+                parts.append(part)
+
+        if not parts:
+            return self.epsilon
+        if len(parts) == 1:
+            return parts[0]
+        return self._make("cat", None, tuple(parts), all(p.nullable for p in parts))
+
+    def union(self, *nodes):
+        # Factoring needs the union of the factored-out remainders, which can
+        # nest as deeply as the expression itself. _union is a generator that
+        # yields those sub-unions, and they are run here with an explicit stack
+        # so the depth is not limited by Python recursion.
+        key = frozenset(n.uid for n in nodes)
+        result = self._unions.get(key)
+        if result is not None:
+            return result
+
+        stack = [(key, self._union(nodes))]
+        while stack:
+            key, frame = stack[-1]
+            try:
+                request = frame.send(result)
+            except StopIteration as done:
+                stack.pop()
+                result = self._unions[key] = done.value
+            else:
+                key = frozenset(n.uid for n in request)
+                result = self._unions.get(key)
+                if result is None:
+                    stack.append((key, self._union(request)))
+        return result
+
+    def _union(self, nodes):
+        seen = set()
+        alternatives = []
+        stack = list(reversed(nodes))
+        while stack:
+            node = stack.pop()
+            if node.kind == "alt":
+                stack.extend(reversed(node.children))
+            elif node.kind != "empty" and node not in seen:
+                seen.add(node)
+                alternatives.append(node)
+
+        # r+r* = r*
+        starred = {a.children[0] for a in alternatives if a.kind == "star"}
+        alternatives = [a for a in alternatives if a not in starred]
+
+        # ε+rr* = ε+r*r = r*
+        if self.epsilon in seen:
+            alternatives = [self._plus_to_star(a) for a in alternatives]
+
+        # ε+r = r when r already matches ε
+        if any(a.nullable and a.kind != "eps" for a in alternatives):
+            alternatives = [a for a in alternatives if a.kind != "eps"]
+
+        if not alternatives:
+            return self.empty
+        if len(alternatives) == 1:
+            return alternatives[0]
+
+        factored = yield from self._factor(alternatives, prefix=True)
+        if factored is None:
+            factored = yield from self._factor(alternatives, prefix=False)
+        if factored is not None:
+            return (yield factored)
+
+        alternatives.sort(key=self._order)
+        return self._make("alt", None, tuple(alternatives),
+                          any(a.nullable for a in alternatives))
+
+    def _plus_to_star(self, node):
+        """Turn rr* or r*r into r*; other nodes are returned unchanged"""
+        if node.kind != "cat":
+            return node
+        first, last = node.children[0], node.children[-1]
+        if last.kind == "star" and self.concat(*node.children[:-1]) is last.children[0]:
+            return last
+        if first.kind == "star" and self.concat(*node.children[1:]) is first.children[0]:
+            return first
+        return node
+
+    def _factor(self, alternatives, prefix):
+        """Factor a shared first (or last) factor out of alternatives.
+
+        Returns the new list of alternatives, or None if nothing was shared.
+        """
+        index = 0 if prefix else -1
+        groups = {}
+        for alt in alternatives:
+            parts = self._parts(alt)
+            if parts:
+                groups.setdefault(parts[index], []).append(alt)
+
+        shared = {head for head, members in groups.items() if len(members) > 1}
+        if not shared:
+            return None
+
+        result = []
+        for alt in alternatives:
+            parts = self._parts(alt)
+            if not parts or parts[index] not in shared:
+                result.append(alt)
+                continue
+            members = groups[parts[index]]
+            if members[0] is not alt:
+                continue
+            head = parts[index]
+            if prefix:
+                rest = yield [self.concat(*self._parts(m)[1:]) for m in members]
+                result.append(self.concat(head, rest))
+            else:
+                rest = yield [self.concat(*self._parts(m)[:-1]) for m in members]
+                result.append(self.concat(rest, head))
+        return result
+
+    def star(self, node):
+        result = self._stars.get(node)
+        if result is None:
+            result = self._stars[node] = self._star(node)
+        return result
+
+    def _star(self, node):
+        if node.kind in ("empty", "eps"):
+            return self.epsilon
+        if node.kind == "star":
+            return node
+        # (r*s*)* = (r*+s*)*
+        if node.kind == "cat" and node.nullable:
+            return self.star(self.union(*node.children))
+        # (ε+r)* = r*  and  (r+s*)* = (r+s)*
+        if node.kind == "alt":
+            inner = self.union(*(c.children[0] if c.kind == "star" else c
+                                 for c in node.children if c.kind != "eps"))
+            if inner is not node:
+                return self.star(inner)
+        return self._make("star", None, (node,), True)
+
+    def to_string(self, node):
+        """Render a node using the minimal number of parentheses"""
+        # Post-order walk with an explicit stack, so deeply nested expressions
+        # are not limited by Python recursion
+        stack = [node]
+        while stack:
+            current = stack[-1]
+            if current in self._text:
+                stack.pop()
+                continue
+            pending = [c for c in current.children if c not in self._text]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            self._text[current] = self._render(current)
+        return self._text[node]
+
+    def _render(self, node):
+        """Render a node whose children have already been rendered"""
+        if node.kind == "empty":
+            return "∅"
+        if node.kind == "eps":
+            return "ε"
+        if node.kind == "sym":
+            return node.value
+        if node.kind == "alt":
+            return "+".join(self._text[c] for c in node.children)
+        if node.kind == "cat":
+            return "".join(self._wrap(c, ("alt",)) for c in node.children)
+        child = node.children[0]
+        if child.kind == "sym" and len(child.value) > 1:
+            return f"({child.value})*"
+        return self._wrap(child, ("alt", "cat")) + "*"
+
+    def _wrap(self, node, kinds):
+        text = self._text[node]
+        return f"({text})" if node.kind in kinds else text
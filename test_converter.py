@@ -0,0 +1,133 @@
+# test_converter.py
+import itertools
+import os
+import re
+
+import pytest
+
+from dfa import DFA
+from converter import convert_dfa_to_regex
+from simplify import RegexSimplifier
+from utils import parse_dfa_file, parse_nfa_file
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "examples")
+MAX_WORD_LENGTH = 7
+
+
+def accepts(dfa, word):
+    state = dfa.start_state
+    for symbol in word:
+        state = dfa.transitions.get((state, symbol))
+        if state is None:
+            return False
+    return state in dfa.accept_states
+
+
+def assert_same_language(dfa):
+    """Check the converted regex against the DFA on every short word"""
+    regex = convert_dfa_to_regex(dfa)
+    pattern = re.compile(regex.replace("+", "|").replace("ε", ""))
+    for length in range(MAX_WORD_LENGTH + 1):
+        for word in map("".join, itertools.product(dfa.alphabet, repeat=length)):
+            assert bool(pattern.fullmatch(word)) == accepts(dfa, word), (regex, word)
+
+
+@pytest.mark.parametrize("filename", [
+    "dfa_example.txt",
+    "example1.txt",
+    "example2.txt",
+])
+def test_dfa_examples_keep_language(filename):
+    assert_same_language(parse_dfa_file(os.path.join(EXAMPLES, filename)))
+
+
+@pytest.mark.parametrize("filename", [
+    "nfa_example.txt",
+    "nfa_epsilon_example.txt",
+])
+def test_nfa_examples_keep_language(filename):
+    assert_same_language(parse_nfa_file(os.path.join(EXAMPLES, filename)).to_dfa())
+
+
+def test_small_dfas_keep_language():
+    # Words with an even number of a's
+    assert_same_language(DFA(["e", "o"], ["a", "b"],
+                             [("e", "a", "o"), ("e", "b", "e"), ("o", "a", "e"), ("o", "b", "o")],
+                             "e", ["e"]))
+    # Words ending in ab, with a missing transition
+    assert_same_language(DFA(["p", "q", "r"], ["a", "b"],
+                             [("p", "a", "q"), ("p", "b", "p"), ("q", "a", "q"), ("q", "b", "r"),
+                              ("r", "a", "q")],
+                             "p", ["r"]))
+    # Every state accepting
+    assert_same_language(DFA(["x", "y"], ["a", "b", "c"],
+                             [("x", "a", "y"), ("y", "b", "x"), ("y", "c", "y")],
+                             "x", ["x", "y"]))
+
+
+def test_no_accepting_paths():
+    dfa = DFA(["p", "q"], ["a"], [("p", "a", "p")], "p", ["q"])
+    assert convert_dfa_to_regex(dfa) == "No accepting paths"
+
+
+def chain_dfa(n):
+    """q0 -a-> q1 -a-> ... -a-> q(n-1), with b edges leading back"""
+    states = [f"q{i:04d}" for i in range(n)][::-1]
+    transitions = [(states[i], "a", states[i + 1]) for i in range(n - 1)]
+    transitions += [(states[i + 1], "b", states[i]) for i in range(n - 1)]
+    return DFA(states, ["a", "b"], transitions, states[0], [states[0]])
+
+
+def test_deeply_nested_dfa():
+    # The result nests one star per state, deeper than the Python recursion limit
+    regex = convert_dfa_to_regex(chain_dfa(400))
+    assert regex == "(a" * 399 + "b)*" * 399
+
+
+def test_absorbs_epsilon_and_empty():
+    s = RegexSimplifier()
+    a, b = s.symbol("a"), s.symbol("b")
+    assert s.concat(a, s.epsilon, b) is s.concat(a, b)
+    assert s.concat(a, s.empty) is s.empty
+    assert s.union(a, s.empty) is a
+    assert s.union(s.epsilon, s.star(a)) is s.star(a)
+
+
+def test_star_identities():
+    s = RegexSimplifier()
+    a, b = s.symbol("a"), s.symbol("b")
+    assert s.star(s.star(a)) is s.star(a)
+    assert s.star(s.union(s.epsilon, a)) is s.star(a)
+    assert s.star(s.empty) is s.epsilon
+    assert s.to_string(s.star(s.union(a, s.star(b)))) == "(a+b)*"
+    assert s.concat(s.star(a), s.star(a)) is s.star(a)
+
+
+def test_plus_to_star():
+    s = RegexSimplifier()
+    a = s.symbol("a")
+    assert s.union(s.epsilon, s.concat(a, s.star(a))) is s.star(a)
+    assert s.union(s.epsilon, s.concat(s.star(a), a)) is s.star(a)
+
+
+def test_union_dedup_and_order():
+    s = RegexSimplifier()
+    a, b = s.symbol("a"), s.symbol("b")
+    assert s.union(b, a, b) is s.union(a, b)
+    assert s.to_string(s.union(b, s.epsilon, a)) == "ε+a+b"
+
+
+def test_factors_common_prefix_and_suffix():
+    s = RegexSimplifier()
+    a, b, c = s.symbol("a"), s.symbol("b"), s.symbol("c")
+    assert s.to_string(s.union(s.concat(a, b), s.concat(a, c))) == "a(b+c)"
+    assert s.to_string(s.union(s.concat(b, a), s.concat(c, a))) == "(b+c)a"
+    assert s.to_string(s.union(a, s.concat(a, b))) == "a(ε+b)"
+
+
+def test_minimal_parentheses():
+    s = RegexSimplifier()
+    a, b = s.symbol("a"), s.symbol("b")
+    assert s.to_string(s.concat(s.star(s.concat(a, b)), a)) == "(ab)*a"
+    assert s.to_string(s.union(s.concat(a, b), s.star(b))) == "ab+b*"
+    assert s.to_string(s.star(s.symbol("ab"))) == "(ab)*"